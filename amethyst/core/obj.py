@@ -66,12 +66,22 @@ amethyst_deflate
 amethyst_inflate
 """.split()
 
+import copy
+import enum
 import inspect
 import json
 import numbers
+import operator
+import sys
+import uuid
 import warnings
 
-from .util import coalesce, smartmatch, get_class
+from .util import get_class, smartmatcher, RE_TYPE
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class AmethystException(Exception): pass
@@ -81,6 +91,106 @@ class DuplicateAttributeException(AmethystException): pass
 
 UNIQUE1 = object()
 UNIQUE2 = object()
+_MISSING = object()
+_META_KEYS = frozenset(("__class__",))# Keys ignored by validation
+_UNPICKLED_SLOTS = frozenset(("__weakref__", "__dict__", "_amethyst_json_cache"))
+_SMARTMATCH_CACHE_SIZE = 512
+
+
+def _caller_module():
+    """
+    Module of the nearest calling frame outside of this module. Walks the
+    frames rather than using a fixed stack depth so that it works whether
+    or not this module has been compiled (compiled functions have no
+    python frame).
+    """
+    frame = inspect.currentframe()
+    while frame is not None and frame.f_globals.get("__name__") == __name__:
+        frame = frame.f_back
+    return inspect.getmodule(frame)
+
+
+# Attr modifier operations. Each takes an already-validated value and
+# returns a (possibly modified) value or raises a ValueError.
+def _duck(method, *args):
+    """Call value.method(*args) if the value has such a method."""
+    def op(value):
+        fn = getattr(value, method, None)
+        return value if fn is None else fn(*args)
+    return op
+
+def _check(test, other):
+    """Pass value through if test(value, other) is true."""
+    def op(value):
+        if test(value, other): return value
+        raise ValueError("Invalid Value")
+    op._amethyst_check = (test, other)
+    return op
+
+def _check_both(first, second):
+    """
+    Pass value through if both `(test, other)` checks are true. Used to
+    fuse a pair of adjacent comparisons (usually a range) into one operation.
+    """
+    (test1, other1), (test2, other2) = first, second
+    def op(value):
+        if test1(value, other1) and test2(value, other2): return value
+        raise ValueError("Invalid Value")
+    return op
+
+def _smartmatch(other, negate=False):
+    """
+    :py:func:`amethyst.core.util.smartmatcher` for `other`, additionally
+    remembering accepted values when matching against a tuple or compiled
+    regex.
+    """
+    match = smartmatcher(other, negate)
+    if not isinstance(other, (tuple, RE_TYPE)):
+        return match
+
+    # Linear scans and regex searches are worth remembering. Only
+    # immutable `other` may be cached, a list may be modified by its owner
+    # after the Attr is built. Only accepted values are cached (the result
+    # is the value itself).
+    passed = set()
+    def op(val):
+        try:
+            if val in passed: return val
+            hashable = True
+        except TypeError:
+            hashable = False
+        match(val)
+        if hashable:
+            if len(passed) >= _SMARTMATCH_CACHE_SIZE:
+                passed.clear()
+            passed.add(val)
+        return val
+    return op
+
+
+class _Either(object):
+    """
+    Converter which tries each option in turn, see :py:func:`Attr.__or__`.
+    Callable options are tried in order, the first not raising a
+    ValueError provides the value. Other options are accepted when equal to
+    the value. If no option succeeds, the last ValueError is raised.
+    """
+    __slots__ = ('options',)
+
+    def __init__(self, options):
+        self.options = options
+
+    def __call__(self, value):
+        err = ValueError("Invalid value")
+        for option in self.options:
+            if callable(option):
+                try:
+                    return option(value)
+                except ValueError as e:
+                    err = e
+            elif value == option:
+                return option
+        raise err
 
 
 class Attr(object):
@@ -117,6 +227,12 @@ class Attr(object):
 
     :ivar name: Attribute name when assigned to an Object (auto-set by metaclass).
     """
+    __slots__ = (
+        'convert', 'isa', 'verify', 'fget', 'fset', 'fdel', 'doc', 'default',
+        'builder', 'OVERRIDE', 'name', '_ops', '_package',
+        '_last_convert', '_convert', '_convert_is_type',
+    )
+
     def __init__(self, convert=None, verify=None, isa=None, default=None, builder=None, fget=None, fset=None, fdel=None, doc=None, OVERRIDE=False):
         """
         :param convert: Attribute converter. Must be a callable or else a
@@ -174,11 +290,13 @@ class Attr(object):
         self.default = default
         self.builder = builder
         self.OVERRIDE = OVERRIDE
+        self._ops    = ()
+        self._last_convert = None
 
         self._package = None
         if isinstance(convert, str) and (convert.startswith('.') or '.' not in convert):
             try:
-                self._package = inspect.getmodule(inspect.stack()[1][0])
+                self._package = _caller_module()
             except Exception:
                 pass
 
@@ -187,18 +305,18 @@ class Attr(object):
         """ """
         if self.fget is None and self.fset is None and self.fdel is None:
 
-            def fget(obj):
-                try:
-                    return obj.dict[name]
-                except KeyError:
+            def fget(obj, _missing=_MISSING):
+                d = obj.dict
+                value = d.get(name, _missing)
+                if value is _missing:
                     # default happens before builder
                     if self.default is not None:
-                        obj.dict[name] = self(self.get_default(), name)
-                        return obj.dict[name]
-                    if self.builder is not None:
-                        obj.dict[name] = self(self.builder(), name)
-                        return obj.dict[name]
-                return None
+                        value = d[name] = self(self.get_default(), name)
+                    elif self.builder is not None:
+                        value = d[name] = self(self.builder(), name)
+                    else:
+                        value = None
+                return value
 
             def fset(obj, value):
                 obj.amethyst_assert_mutable()
@@ -234,59 +352,74 @@ class Attr(object):
 
     def __call__(self, value, key=None):
         """ """
-        if self.convert:
-            if getattr(self, "_last_convert", None) is not self.convert:
-                self._last_convert = self._convert = self.convert
-                if not callable(self.convert):
-                    self._convert = get_class(self.convert, package=self._package, frame=None)
+        convert = self.convert
+        if convert:
+            if self._last_convert is not convert:
+                self._last_convert = self._convert = convert
+                if not callable(convert):
+                    self._convert = get_class(convert, package=self._package, frame=None)
                 self._convert_is_type = isinstance(self._convert, type)
-            if not (self._convert_is_type and isinstance(value, self._convert)):
-                value = self._convert(value)
+            conv = self._convert
+            if not (self._convert_is_type and (type(value) is conv or isinstance(value, conv))):
+                value = conv(value)
 
-        if self.isa:
-            if not isinstance(value, self.isa):
-                raise ValueError("Value of '{}' is not an instance of {}".format(key, str(self.isa)))
+        isa = self.isa
+        if isa:
+            if type(value) is not isa and not isinstance(value, isa):
+                raise ValueError("Value of '{}' is not an instance of {}".format(key, str(isa)))
 
         if self.verify:
             if not self.verify(value):
                 raise ValueError("Value of '{}' does not satisfy verification callback".format(key))
 
+        if self._ops:
+            for op in self._ops:
+                value = op(value)
+
         return value
 
+    def _chain(self, op):
+        """
+        Return a new attribute which passes values through `op` after this
+        attribute's validation. Modifiers are collected into a flat tuple
+        of operations rather than nesting closures, so `Attr(str).strip().lower()`
+        costs one call to validate rather than three.
+        """
+        if type(self).__call__ is not Attr.__call__:
+            # Subclass does its own thing, wrap rather than flatten
+            return self.__class__(lambda v: op(self(v))).copy_meta(self)
+        new = copy.copy(self)
+        new.default = new.builder = None
+        new.fget = new.fset = new.fdel = None
+        new._ops = self._ops + (op,)
+        return new
+
     def __and__(self, other):
         """ """
-        return self.__class__(lambda v: other(self(v))).copy_meta(self, other)
+        return self._chain(other).copy_meta(other)
     def __rand__(self, other):
         """ """
         return self.__class__(lambda v: self(other(v))).copy_meta(self, other)
 
     def __or__(self, other):
         """ """
-        def convert(value):
-            try:
-                return self(value)
-            except ValueError as err:
-                if callable(other):
-                    return other(value)
-                elif value == other:
-                    return other
-                else:
-                    raise err
-        return self.__class__(convert).copy_meta(self, other)
+        return self.__class__(_Either(self._alternatives() + (other,))).copy_meta(self, other)
 
     def __ror__(self, other):
         """ """
-        def convert(value):
-            try:
-                if callable(other):
-                    return other(value)
-                elif value == other:
-                    return other
-                else:
-                    raise ValueError("Invalid value")
-            except ValueError:
-                return self(value)
-        return self.__class__(convert).copy_meta(self, other)
+        return self.__class__(_Either((other,) + self._alternatives())).copy_meta(self, other)
+
+    def _alternatives(self):
+        """
+        Options to try when this attribute is combined using `|`. An
+        attribute which is itself just a combination of alternatives
+        contributes its options, so that `a | b | c` tries each in a
+        single flat loop rather than nesting.
+        """
+        if (type(self.convert) is _Either and self.isa is None and self.verify is None
+                and not self._ops and type(self).__call__ is Attr.__call__):
+            return self.convert.options
+        return (self,)
 
     __hash__ = None   # has __eq__ but isn't hashable
     def __eq__(self, other):
@@ -301,65 +434,56 @@ class Attr(object):
            GOOD:: :code:`{ "a": "A", "b": "B",  "A": "A", "B": "B" }`
 
            BAD:: :code:`{ "a": "A", "b": "B" }  # will fail on repeated validation since "A" and "B" are not keys`
+
+        When matching against a tuple or compiled regex, accepted (hashable)
+        values are remembered so that repeated values are validated by
+        a single set lookup.
         """
-        return self.__class__(lambda v: smartmatch(self(v), other)).copy_meta(self)
+        return self._chain(_smartmatch(other))
     def __ne__(self, other):
         """Ensure no smartmatch"""
-        def convert(value):
-            val = self(value)
-            try:
-                # If we do not match the other value, this raises an
-                # exception (thus we can return val).
-                smartmatch(val, other)
-            except ValueError:
-                return val
-            # otherwise, we've matched the smartmatch, this we match what
-            # we don't want to be - raise a value error.
-            raise ValueError("Invalid Value")
-        return self.__class__(convert).copy_meta(self)
+        return self._chain(_smartmatch(other, negate=True))
+
+    def _chain_check(self, test, other):
+        """
+        Chain a comparison. Two adjacent comparisons are fused into
+        a single operation, so that `(0 <= Attr(int)) <= 200` costs one
+        call to check the range rather than two.
+        """
+        # Private marker, the last op may be any user callable
+        last = getattr(self._ops[-1], "_amethyst_check", None) if self._ops else None
+        if last is None or type(self).__call__ is not Attr.__call__:
+            return self._chain(_check(test, other))
+        new = self._chain(_check_both(last, (test, other)))
+        new._ops = self._ops[:-1] + new._ops[-1:]
+        return new
 
     # This is starting to get cute:
     def __lt__(self, other):
         """ """
-        def convert(value):
-            val = self(value)
-            if val < other: return val
-            raise ValueError("Invalid Value")
-        return self.__class__(convert).copy_meta(self)
+        return self._chain_check(operator.lt, other)
     def __le__(self, other):
         """ """
-        def convert(value):
-            val = self(value)
-            if val <= other: return val
-            raise ValueError("Invalid Value")
-        return self.__class__(convert).copy_meta(self)
+        return self._chain_check(operator.le, other)
     def __ge__(self, other):
         """ """
-        def convert(value):
-            val = self(value)
-            if val >= other: return val
-            raise ValueError("Invalid Value")
-        return self.__class__(convert).copy_meta(self)
+        return self._chain_check(operator.ge, other)
     def __gt__(self, other):
         """ """
-        def convert(value):
-            val = self(value)
-            if val > other: return val
-            raise ValueError("Invalid Value")
-        return self.__class__(convert).copy_meta(self)
+        return self._chain_check(operator.gt, other)
 
     # These modifiers make no sense unless they are idempotent since we may
     # validate multiple times. Thus, we only define those whose semantics
     # swing that way.
     def __mod__(self, other):
         """ """
-        return self.__class__(lambda v: self(v) % other).copy_meta(self)
+        return self._chain(lambda v: v % other)
     def __pos__(self):
         """ """
-        return self.__class__(lambda v: +self(v)).copy_meta(self)
+        return self._chain(operator.pos)
     def __abs__(self):
         """ """
-        return self.__class__(lambda v: abs(self(v))).copy_meta(self)
+        return self._chain(abs)
 
     # I don't see much use for float() since it is the first thing you
     # would want to do. However, int() could be useful since
@@ -368,89 +492,120 @@ class Attr(object):
     # include complex too.
     def float(self):
         """ """
-        return self.__class__(lambda v: float(self(v))).copy_meta(self)
+        return self._chain(float)
     def int(self):
         """ """
-        return self.__class__(lambda v: int(self(v))).copy_meta(self)
+        return self._chain(int)
     def complex(self):
         """ """
-        return self.__class__(lambda v: complex(self(v))).copy_meta(self)
+        return self._chain(complex)
 
     # Can also define a handful of common methods one might wish to call,
     # and call them if present. Happy duck-typing.
     def strip(self, chars=None):
         """Return a new attribute which strips whitespace if applicable (duck typing)."""
-        def convert(value):
-            value = self(value)
-            return value.strip(chars) if hasattr(value, "strip") else value
-        return self.__class__(convert).copy_meta(self)
+        return self._chain(_duck("strip", chars))
     def rstrip(self, chars=None):
         """Return a new attribute which strips whitespace from the right side if applicable (duck typing)."""
-        def convert(value):
-            value = self(value)
-            return value.rstrip(chars) if hasattr(value, "rstrip") else value
-        return self.__class__(convert).copy_meta(self)
+        return self._chain(_duck("rstrip", chars))
     def lstrip(self, chars=None):
         """Return a new attribute which strips whitespace from the left side if applicable (duck typing)."""
-        def convert(value):
-            value = self(value)
-            return value.lstrip(chars) if hasattr(value, "lstrip") else value
-        return self.__class__(convert).copy_meta(self)
+        return self._chain(_duck("lstrip", chars))
 
     def encode(self, encoding="UTF-8", errors="strict"):
         """Return a new attribute which encodes value if applicable (duck typing). Defaults to UTF-8 encoding."""
-        def convert(value):
-            value = self(value)
-            return value.encode(encoding, errors) if hasattr(value, "encode") else value
-        return self.__class__(convert).copy_meta(self)
+        return self._chain(_duck("encode", encoding, errors))
     def decode(self, encoding="UTF-8", errors="strict"):
         """Return a new attribute which decodes value if applicable (duck typing). Defaults to UTF-8 encoding."""
-        def convert(value):
-            value = self(value)
-            return value.decode(encoding, errors) if hasattr(value, "decode") else value
-        return self.__class__(convert).copy_meta(self)
+        return self._chain(_duck("decode", encoding, errors))
 
     def lower(self):
         """Return a new attribute which lower-cases value if applicable (duck typing)."""
-        def convert(value):
-            value = self(value)
-            return value.lower() if hasattr(value, "lower") else value
-        return self.__class__(convert).copy_meta(self)
+        return self._chain(_duck("lower"))
     def upper(self):
         """Return a new attribute which upper-cases value if applicable (duck typing)."""
-        def convert(value):
-            value = self(value)
-            return value.upper() if hasattr(value, "upper") else value
-        return self.__class__(convert).copy_meta(self)
+        return self._chain(_duck("upper"))
     def title(self):
         """Return a new attribute which title-cases value if applicable (duck typing)."""
-        def convert(value):
-            value = self(value)
-            return value.title() if hasattr(value, "title") else value
-        return self.__class__(convert).copy_meta(self)
+        return self._chain(_duck("title"))
     def capitalize(self):
         """Return a new attribute which capitalizes value if applicable (duck typing)."""
-        def convert(value):
-            value = self(value)
-            return value.capitalize() if hasattr(value, "capitalize") else value
-        return self.__class__(convert).copy_meta(self)
+        return self._chain(_duck("capitalize"))
     def casefold(self):
         """Return a new attribute which casefolds value if applicable (duck typing)."""
-        def convert(value):
-            value = self(value)
-            return value.casefold() if hasattr(value, "casefold") else value
-        return self.__class__(convert).copy_meta(self)
+        return self._chain(_duck("casefold"))
 
     def split(self, sep=None, maxsplit=-1):
         """Return a new attribute which splits its value if applicable (duck typing)."""
-        def convert(value):
-            value = self(value)
-            return value.split(sep, maxsplit) if hasattr(value, "split") else value
-        return self.__class__(convert).copy_meta(self)
+        return self._chain(_duck("split", sep, maxsplit))
+
+
+class _WrappedEncoder(object):
+    """Encoder which wraps the encoded object in a single-key dict."""
+    __slots__ = ('name', 'encode')
 
+    def __init__(self, name, encode):
+        self.name = name
+        self.encode = encode
+
+    def __call__(self, obj):
+        return { self.name: self.encode(obj) }
+
+
+# Bumped whenever an encoder or hook table is modified so that per-class
+# merged tables know to rebuild.
+_amethyst_registry_version = 0
+
+def _tracked(method):
+    def tracked(self, *args, **kwargs):
+        global _amethyst_registry_version
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            _amethyst_registry_version += 1
+    tracked.__name__ = method.__name__
+    tracked.__doc__ = method.__doc__
+    return tracked
+
+class _TrackedDict(dict):
+    """
+    Dict used for the encoder and hook tables. Every modification bumps
+    the table version so that merged per-class tables are rebuilt.
+    """
+    __slots__ = ()
+
+for _name in ("__setitem__", "__delitem__", "__ior__", "clear", "pop", "popitem", "setdefault", "update"):
+    setattr(_TrackedDict, _name, _tracked(getattr(dict, _name)))
+del _name
+
+_TABLE_ATTRS = frozenset(("_jsonencoders", "_jsonhooks"))
+global_amethyst_encoders = _TrackedDict()
+global_amethyst_hooks = _TrackedDict()
+
+def _merge_json_tables(cls):
+    """
+    Merge the global encoder and hook tables with the class-local ones
+    (local entries win) into `cls._merged_jsonencoders` and
+    `cls._merged_jsonhooks`.
+    """
+    version = _amethyst_registry_version
+    cls._merged_jsonencoders = { **global_amethyst_encoders, **cls._jsonencoders }
+    cls._merged_jsonhooks = { **global_amethyst_hooks, **cls._jsonhooks }
+    cls._merged_orjson_safe = None# Computed by toJSON when needed
+    cls._merged_version = version
+
+def _merged_class(obj):
+    """
+    The amethyst Object class of `obj` (an Object or Object class) with
+    up-to-date merged tables, or None if `obj` is not an amethyst Object.
+    """
+    cls = obj if isinstance(obj, type) else type(obj)
+    if not isinstance(cls, AttrsMetaclass):
+        return None
+    if cls._merged_version != _amethyst_registry_version:
+        _merge_json_tables(cls)
+    return cls
 
-global_amethyst_encoders = dict()
-global_amethyst_hooks = dict()
 def register_amethyst_type(cls, encode, decode, name=None, overwrite=False, wrap_encode=True):
     """
     Adds a type to the global list (:py:data:`global_amethyst_encoders`)
@@ -506,12 +661,13 @@ def register_amethyst_type(cls, encode, decode, name=None, overwrite=False, wrap
             name = cls._dundername
         else:
             name = "__{}.{}__".format(cls.__module__, cls.__name__)
+    name = sys.intern(name)
     if cls in global_amethyst_encoders and not overwrite:
         raise ValueError("Class encoder '{}' already registered".format(cls))
     if name in global_amethyst_hooks and not overwrite:
         raise ValueError("Class hook '{}' already registered".format(name))
     if wrap_encode:
-        global_amethyst_encoders[cls] = lambda obj: { name: encode(obj) }
+        global_amethyst_encoders[cls] = _WrappedEncoder(name, encode)
     else:
         global_amethyst_encoders[cls] = encode
     global_amethyst_hooks[name] = decode
@@ -530,8 +686,6 @@ def amethyst_deflate(obj, deflator=None):
     Note: If your target is JSON, the amethyst object's :py:func:`Object.toJSON` method is
     probably better.
     """
-    global global_amethyst_encoders
-
     if obj is None or isinstance(obj, (str, bytes, numbers.Number, bool)):
         return obj
     elif isinstance(obj, dict):
@@ -540,11 +694,18 @@ def amethyst_deflate(obj, deflator=None):
         return [ amethyst_deflate(k, deflator) for k in obj ]
     elif isinstance(obj, tuple):
         return tuple(amethyst_deflate(k, deflator) for k in obj)
-    elif hasattr(deflator, "_jsonencoders") and obj.__class__ in deflator._jsonencoders:
-        return amethyst_deflate(deflator._jsonencoders[obj.__class__](obj), deflator)
-    elif obj.__class__ in global_amethyst_encoders:
-        return amethyst_deflate(global_amethyst_encoders[obj.__class__](obj), deflator)
-    raise TypeError("Can't encode {}".format(repr(obj)))
+    encoder = None
+    if deflator is not None:
+        cls = _merged_class(deflator)
+        if cls is not None:
+            encoder = cls._merged_jsonencoders.get(obj.__class__)
+        elif hasattr(deflator, "_jsonencoders"):
+            encoder = deflator._jsonencoders.get(obj.__class__)
+    if encoder is None:
+        encoder = global_amethyst_encoders.get(obj.__class__)
+    if encoder is not None:
+        return amethyst_deflate(encoder(obj), deflator)
+    raise TypeError("Can't encode object of type {}".format(type(obj).__name__))
 
 
 def amethyst_inflate(obj, inflator=None, start=0):
@@ -567,8 +728,6 @@ def amethyst_inflate(obj, inflator=None, start=0):
       If your source is JSON, the amethyst object's :py:func:`Object.fromJSON`
       or class :py:func:`Object.newFromJSON` method is probably better.
     """
-    global global_amethyst_hooks
-
     if isinstance(obj, dict):
         # Look for *single-key* or *flat* style annotations
         key = data = None
@@ -582,10 +741,17 @@ def amethyst_inflate(obj, inflator=None, start=0):
 
         # If annotated, try to inflate
         if key is not None:
-            if hasattr(inflator, "_jsonhooks") and key in inflator._jsonhooks:
-                return inflator._jsonhooks[key](data)
-            elif key in global_amethyst_hooks:
-                return global_amethyst_hooks[key](data)
+            hook = None
+            if inflator is not None:
+                cls = _merged_class(inflator)
+                if cls is not None:
+                    hook = cls._merged_jsonhooks.get(key)
+                elif hasattr(inflator, "_jsonhooks"):
+                    hook = inflator._jsonhooks.get(key)
+            if hook is None:
+                hook = global_amethyst_hooks.get(key)
+            if hook is not None:
+                return hook(data)
 
         # If not annotated or inflation fails (unknown class), inflate values:
         for key in obj:
@@ -598,11 +764,101 @@ def amethyst_inflate(obj, inflator=None, start=0):
     return obj
 
 
+def _orjson_safe(encoders):
+    """
+    False if orjson would serialize any of the types in the encoder table
+    itself, without calling `default`, even with the passthrough options
+    from :py:func:`_orjson_option`.
+    """
+    for typ in encoders:
+        if not isinstance(typ, type):
+            continue
+        if issubclass(typ, (uuid.UUID, enum.Enum)) or typ.__module__.partition(".")[0] == "numpy":
+            return False
+    return True
+
+def _orjson_option(kwargs):
+    """
+    orjson option flags equivalent to the given json.dumps parameters, or
+    None if they include something orjson can not do. Types which orjson
+    would otherwise serialize itself (datetimes, dataclasses, and
+    subclasses of str, int, dict, list) are passed to `default` so that
+    registered encoders are used.
+    """
+    option = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+              | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_SUBCLASS)
+    for key, val in kwargs.items():
+        if key == "sort_keys":
+            if val: option |= orjson.OPT_SORT_KEYS
+        elif key == "indent" and val in (None, 2):
+            if val: option |= orjson.OPT_INDENT_2
+        else:
+            return None
+    return option
+
+
+def _apply_object_hook(obj, hook):
+    """
+    Apply a json `object_hook` to an already decoded structure. Like the
+    json module, dicts are passed to the hook innermost first.
+    """
+    if type(obj) is dict:
+        for key, val in obj.items():
+            if type(val) is dict or type(val) is list:
+                obj[key] = _apply_object_hook(val, hook)
+        return hook(obj)
+    elif type(obj) is list:
+        for i, val in enumerate(obj):
+            if type(val) is dict or type(val) is list:
+                obj[i] = _apply_object_hook(val, hook)
+    return obj
+
+
 # Python3 moved the builtin modules around, force the name so py3 can talk to py2
 register_amethyst_type(set, list, set, name="__set__", wrap_encode=False)
 register_amethyst_type(frozenset, list, frozenset, name="__frozenset__", wrap_encode=False)
 
 
+def _default_factory(attr):
+    """Zero-argument callable producing the attr default, or None if no default."""
+    if attr.default is None:
+        return None
+    if callable(attr.default):
+        return attr.default
+    return lambda dflt=attr.default: dflt
+
+
+def _build_validator(cls, strategy):
+    """
+    Generate a straight-line validation function for the attributes of
+    `cls` and the given import strategy. The result behaves like the
+    generic loop in :py:func:`Object.amethyst_validate_data`, but each
+    attribute and default factory is bound to a local name so no
+    per-attribute iteration or tuple unpacking is needed.
+    """
+    ns = dict(allowed=cls._attrs_keyset | _META_KEYS, dundername=cls._dundername)
+    src = [ "def validate(d, takeover=False):" ]
+    if strategy == "strict":
+        src.append("    keys = d.keys() - allowed")
+        src.append("    if keys:")
+        src.append("        raise ValueError('keys {} not permitted in {} object'.format(keys, dundername))")
+    if strategy == "sloppy":
+        src.append("    data = (d if takeover else d.copy())")
+        src.append("    data.pop('__class__', None)")
+    else:
+        src.append("    data = dict()")
+    for i, (name, attr, dflt) in enumerate(cls._attrs_seq):
+        ns["attr{}".format(i)] = attr
+        src.append("    if {0!r} in d: data[{0!r}] = attr{1}(d[{0!r}], {0!r})".format(name, i))
+        if dflt is not None:
+            ns["dflt{}".format(i)] = dflt
+            src.append("    else: data[{!r}] = dflt{}()".format(name, i))
+    src.append("    return data")
+    filename = "<amethyst {}.{} validate_{}>".format(cls.__module__, cls.__name__, strategy)
+    exec(compile("\n".join(src), filename, "exec"), ns)
+    return ns["validate"]
+
+
 class AttrsMetaclass(type):
     """
     Metaclass for Amethyst Object class descendants. Simply looks at all
@@ -610,6 +866,9 @@ class AttrsMetaclass(type):
     :py:class:`Attr` itself is saved to the :py:attr:`_attrs` class
     attribute (a dictionary) and a property created in its place via the
     Attr :py:func:`Attr.build_property` method.
+
+    The attributes are additionally frozen into the :py:attr:`_attrs_seq`
+    tuple of `(name, attr, default_factory)` rows for fast iteration.
     """
     def __new__(cls, class_name, bases, attrs):
         new_attrs = dict()
@@ -618,7 +877,7 @@ class AttrsMetaclass(type):
                 new_attrs[name] = attrs.pop(name)
                 new_attrs[name].name = name
 
-        new_cls = super(AttrsMetaclass, cls).__new__(cls, class_name, bases, attrs)
+        new_cls = super().__new__(cls, class_name, bases, attrs)
 
         # Need some bootstrapping
         if class_name != 'BaseObject' and attrs.get("amethyst_register_type", True):
@@ -632,10 +891,14 @@ class AttrsMetaclass(type):
         # Merge json hooks into the base _json* hooks.
         for jattr in "jsonhooks", "jsonencoders":
             _jattr = "_" + jattr
-            setattr(new_cls, _jattr, dict(getattr(new_cls, _jattr, ())))# Shallow clone
-            if hasattr(new_cls, jattr):
-                getattr(new_cls, _jattr).update(getattr(new_cls, jattr))
+            table = dict(getattr(new_cls, _jattr, ()))# Shallow clone
+            if jattr in new_cls.__dict__:
+                table.update(new_cls.__dict__[jattr])
+                if jattr == "jsonhooks":
+                    # Hook keys are probed once per decoded JSON object
+                    table = { (sys.intern(k) if type(k) is str else k): v for k, v in table.items() }
                 delattr(new_cls, jattr)
+            setattr(new_cls, _jattr, table)
 
         for name, attr in new_attrs.items():
             if not attr.OVERRIDE and hasattr(new_cls, name):
@@ -644,15 +907,34 @@ class AttrsMetaclass(type):
 
         new_cls._attrs = new_cls._attrs.copy() if hasattr(new_cls, '_attrs') else dict()
         new_cls._attrs.update(new_attrs)
-        new_cls._dundername = "__{}.{}__".format(new_cls.__module__, new_cls.__name__)
+        new_cls._attrs_seq = tuple(
+            (name, attr, _default_factory(attr)) for name, attr in new_cls._attrs.items()
+        )
+        new_cls._attrs_keyset = frozenset(new_cls._attrs)
+        new_cls._attrs_defaults = tuple(
+            (name, dflt) for name, attr, dflt in new_cls._attrs_seq if dflt is not None
+        )
+        new_cls._amethyst_validators = dict()# Built on demand by amethyst_validate_data
+        new_cls._dundername = sys.intern("__{}.{}__".format(new_cls.__module__, new_cls.__name__))
+        new_cls._merged_version = -1# Tables are merged on first use
 
         return new_cls
 
+    def __setattr__(cls, name, value):
+        # Encoder and hook tables assigned after class creation must be
+        # tracked too, or the merged tables would not see later changes.
+        if name in _TABLE_ATTRS:
+            global _amethyst_registry_version
+            if type(value) is not _TrackedDict:
+                value = _TrackedDict(value)
+            _amethyst_registry_version += 1
+        super().__setattr__(name, value)
+
 
 # Manually create a base object so that we can run in both python 2 and 3.
 #
 #   https://wiki.python.org/moin/PortingToPy3k/BilingualQuickRef#metaclasses
-BaseObject = AttrsMetaclass(str('BaseObject'), (), {})
+BaseObject = AttrsMetaclass(str('BaseObject'), (), { '__slots__': () })
 
 class Object(BaseObject):
     """
@@ -662,6 +944,15 @@ class Object(BaseObject):
       objects. Should not be modified, but can be read for introspection of
       an Object.
 
+    :ivar _attrs_seq: Tuple of `(name, attr, default_factory)` rows built
+      from :py:attr:`_attrs` by the metaclass, where `default_factory` is
+      a callable producing the attribute default or `None`.
+
+    :ivar _attrs_keyset: Frozen set of the :py:attr:`_attrs` names.
+
+    :ivar _attrs_defaults: Tuple of `(name, default_factory)` rows for
+      just those attributes which have a default.
+
     :ivar _jsonencoders: Dictionary mapping class objects to callable
       encoders which should produce a JSON-serializable object. These
       functions are called from the JSONEncoder method. Per the json
@@ -687,7 +978,23 @@ class Object(BaseObject):
         :py:func:`register_amethyst_type` and offers direct access to the
         decoders (behaves like `overwrite=True, wrap_encode=False`)
 
+    :ivar _merged_jsonencoders: The global encoders merged with
+      :py:attr:`_jsonencoders` (class entries win). Built on first use
+      and rebuilt whenever any encoder or hook table is modified.
+
+    :ivar _merged_jsonhooks: The global hooks merged with
+      :py:attr:`_jsonhooks` (class entries win). Built on first use
+      and rebuilt whenever any encoder or hook table is modified.
+
+    .. note::
+      Object declares `__slots__`, so plain `Object()` instances can not
+      hold other attributes. Subclasses have a `__dict__` as usual unless
+      they also declare `__slots__`, in which case any attributes stored
+      outside of the object dict (like `self.other` in the synopsis) must
+      be listed there.
+
     """
+    __slots__ = ('dict', '_amethyst_mutable_', '_amethyst_json_cache', '__weakref__')
 
     amethyst_includeclass  = True
     """
@@ -717,6 +1024,34 @@ class Object(BaseObject):
     amethyst_register_type = True
     amethyst_classhint_style = "flat"
 
+    amethyst_fast_json = False
+    """
+    When True and the optional `orjson` package is installed,
+    :py:func:`toJSON` and :py:func:`fromJSON` calls which pass no extra
+    json parameters (other than `sort_keys` or `indent=2` for toJSON) are
+    handled by orjson. The output is equivalent but
+    more compact than that of the standard json module. Values which orjson
+    can not handle (e.g., integers larger than 64 bits) fall back to the
+    standard json module. Classes whose encoders include UUID, Enum, or
+    numpy types always use the standard json module, since orjson would
+    encode those itself rather than use the registered encoder.
+
+    .. warning::
+      Unlike the standard json module, orjson writes NaN and infinite
+      floats as `null` (they load back as `None`), and encodes UUID and
+      Enum values (as strings and their values) rather than raising
+      a TypeError when no encoder is registered for them.
+    """
+
+    amethyst_cache_json = False
+    """
+    When True, :py:func:`toJSON` output of immutable objects is cached
+    (per set of parameters) until the object is made mutable again.
+    Immutability is shallow, so only enable this if nested values (lists,
+    dicts, other Objects) are not modified after the object is made
+    immutable.
+    """
+
     def __init__(self, *args, **kwargs):
         """
         Initializes self.dict with all passed kwargs.
@@ -727,7 +1062,7 @@ class Object(BaseObject):
            itself is reserved for internal use only and behavior may
            change.
         """
-        super(Object, self).__init__()
+        super().__init__()
         self._amethyst_mutable_ = True
 
         # Special-case of single argument:
@@ -751,9 +1086,10 @@ class Object(BaseObject):
             if data:
                 self.amethyst_load_data(data, verifyclass=False)
 
-        for name, attr in self._attrs.items():
-            if attr.default is not None and name not in self.dict:
-                self.dict[name] = attr.get_default()
+        d = self.dict
+        for name, dflt in self._attrs_defaults:
+            if name not in d:
+                d[name] = dflt()
 
     def amethyst_assert_mutable(self, msg="May not modify, object is immutable"):
         """ """
@@ -767,12 +1103,31 @@ class Object(BaseObject):
     def amethyst_make_mutable(self):
         """ """
         self._amethyst_mutable_ = True
+        self._amethyst_json_cache = None
         return self
     def amethyst_make_immutable(self):
         """ """
         self._amethyst_mutable_ = False
         return self
 
+    def __getstate__(self):
+        """
+        Pickle support. Returns a flat dict of the object state (slot and
+        instance attributes) as was pickled before Object used `__slots__`.
+        """
+        state = dict(getattr(self, "__dict__", ()))
+        for klass in type(self).__mro__:
+            slots = klass.__dict__.get("__slots__", ())
+            for name in ((slots,) if isinstance(slots, str) else slots):
+                if name not in _UNPICKLED_SLOTS and hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state):
+        """Pickle support, see :py:func:`__getstate__`."""
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
     def __str__(self):
         return str(self.dict)
     def __repr__(self):
@@ -812,24 +1167,29 @@ class Object(BaseObject):
         """
         Subclasses: this method may be overridden with an unrelated implementation.
         """
-        for name, attr in self._attrs.items():
-            if name in self.dict:
-                yield name, self.dict[name]
+        d = self.dict
+        for name in self._attrs:
+            val = d.get(name, _MISSING)
+            if val is not _MISSING:
+                yield name, val
     iteritems = items
     def keys(self, **kwargs):
         """
         Subclasses: this method may be overridden with an unrelated implementation.
         """
-        for name, attr in self._attrs.items():
-            if name in self.dict:
+        d = self.dict
+        for name in self._attrs:
+            if name in d:
                 yield name
     def values(self, **kwargs):
         """
         Subclasses: this method may be overridden with an unrelated implementation.
         """
-        for name, attr in self._attrs.items():
-            if name in self.dict:
-                yield self.dict[name]
+        d = self.dict
+        for name in self._attrs:
+            val = d.get(name, _MISSING)
+            if val is not _MISSING:
+                yield val
 
     def __getitem__(self, key):
         """ """
@@ -865,12 +1225,18 @@ class Object(BaseObject):
 
         Subclasses: this method may be overridden with an unrelated implementation.
         """
-        if 2 == len(args) and not kwargs:
-            self[args[0]] = args[1]
-            return self
         self.amethyst_assert_mutable()
-        for i in range(0, len(args), 2):
-            kwargs[args[i]] = args[i+1]
+        if args:
+            if 2 == len(args) and not kwargs:
+                # Common case, set a single attribute directly. Unknown
+                # keys fall through to the import strategy below.
+                key, value = args
+                attr = self._attrs.get(key)
+                if attr is not None:
+                    self.dict[key] = attr(value, key)
+                    return self
+            for i in range(0, len(args), 2):
+                kwargs[args[i]] = args[i+1]
         self.dict.update(self.amethyst_validate_update(kwargs))
         return self
 
@@ -942,17 +1308,22 @@ class Object(BaseObject):
         the `.update()` method (or `.direct_update()` if you decide to accept
         the changes.
         """
-        strategy = coalesce(import_strategy, self.amethyst_import_strategy)
+        strategy = self.amethyst_import_strategy if import_strategy is None else import_strategy
+        attrs = self._attrs
+        if strategy == "strict":
+            if not d.keys() <= self._attrs_keyset:
+                key = next(key for key in d if key not in attrs)
+                raise KeyError("key {} not permitted in {} object".format(key, self._dundername))
+            return { key: attrs[key](val, key) for key, val in d.items() }
+
         data = d.copy() if strategy == "sloppy" else dict()
         for key, val in d.items():
-            attr = self._attrs.get(key)
-            if attr is None and strategy == "strict":
-                raise KeyError("key {} not permitted in {} object".format(key, self._dundername))
-            elif attr is not None:
+            attr = attrs.get(key)
+            if attr is not None:
                 data[key] = attr(val, key)
         return data
 
-    def amethyst_validate_data(self, d, import_strategy=None):
+    def amethyst_validate_data(self, d, import_strategy=None, _takeover=False):
         """
         Convert and validate with the intention of replacing all of the
         object's .dict values. Returns a new dictionary with canonicalized
@@ -974,19 +1345,20 @@ class Object(BaseObject):
         non-Object objects or ensure objects from hand-written config
         files. Be sure to override :py:func:`amethyst_validate_update` as
         well if programmatic updates may need special inflation rules.
+
+        A "__class__" key (see :py:attr:`amethyst_includeclass`) in `d` is
+        ignored and not copied to the result.
+
+        The private `_takeover` flag allows the "sloppy" strategy to reuse
+        (and modify) `d` rather than copying it. It is used internally by
+        :py:func:`amethyst_load_data` and should not be passed otherwise.
         """
-        strategy = coalesce(import_strategy, self.amethyst_import_strategy)
-        data = d.copy() if strategy == "sloppy" else dict()
-        keys = set(d.keys()) if strategy == "strict" else set()
-        for name, attr in self._attrs.items():
-            keys.discard(name)
-            if name in d:
-                data[name] = attr(d[name], name)
-            elif attr.default is not None:
-                data[name] = attr.get_default()
-        if keys:
-            raise ValueError("keys {} not permitted in {} object".format(keys, self._dundername))
-        return data
+        strategy = self.amethyst_import_strategy if import_strategy is None else import_strategy
+        validate = self._amethyst_validators.get(strategy)
+        if validate is None:
+            validate = _build_validator(self.__class__, strategy)
+            self._amethyst_validators[strategy] = validate
+        return validate(d, _takeover)
 
     def attr_value_ok(self, name, value):
         """
@@ -1003,7 +1375,7 @@ class Object(BaseObject):
                 return False
         return False
 
-    def amethyst_load_data(self, data, import_strategy=None, verifyclass=None):
+    def amethyst_load_data(self, data, import_strategy=None, verifyclass=None, unchecked=False):
         """
         Loads a data dictionary with validation. Modifies the passed dict
         and replaces current self.dict object with the one passed.
@@ -1012,6 +1384,13 @@ class Object(BaseObject):
 
         :param verifyclass: Provides a local override to the :py:attr:`amethyst_verifyclass` class attribute.
 
+        :param unchecked: When true, the data is trusted and used as-is
+           (apart from removing any class hint and filling in defaults):
+           attribute conversion and validation are skipped, as is the
+           import strategy. Only use this for data known to have been
+           produced by this class, for instance by :py:func:`toJSON` on
+           a trusted server.
+
         This method transparently loads data in either "single-key" or "flat" formats::
 
             { "__my.module.MyClass__": { ... obj.dict ... } }
@@ -1021,43 +1400,70 @@ class Object(BaseObject):
         Keep in mind that the default base value for :py:attr:`amethyst_verifyclass` is
         True, so, by default, at least one of the class identification keys
         is expected to be present.
+
+        If passed an object of exactly this class, its data has already
+        been validated and is shallow-copied without further validation.
         """
         self.amethyst_assert_mutable()
-        verifyclass = coalesce(verifyclass, self.amethyst_verifyclass)
+        if type(data) is type(self):
+            self.dict = dict(data.dict)
+            return self
+
+        if verifyclass is None:
+            verifyclass = self.amethyst_verifyclass
+
+        dundername = self._dundername
+        owned = True# data is ours to modify, per docs
 
-        # We only deal in dicts here
-        if isinstance(data, self.__class__):
-            verifyclass = False
+        # We only deal in dicts here (plain dicts being the common case)
+        if type(data) is not dict:
+            if isinstance(data, self.__class__):
+                verifyclass = False
 
-        if isinstance(data, Object):
-            data = data.dict
+            if isinstance(data, Object):
+                data = data.dict
+                owned = False
 
-        if not isinstance(data, dict):
-            raise ValueError("expected dictionary object")
+            if not isinstance(data, dict):
+                raise ValueError("expected dictionary object")
 
         # Accept data in single-key mode. Pop out the inner dict and, if
         # the indicated class name is what we expect, we can bypass the
         # class verification step.
         if 1 == len(data):
-            for key in data:
-                if key == self._dundername:
-                    verifyclass = False# We're good
-                    data = data[key]
-                    if not isinstance(data, dict):
-                        raise ValueError("expected dictionary object")
+            key = next(iter(data))
+            if key == dundername:
+                verifyclass = False# We're good
+                data = data[key]
+                if type(data) is not dict and not isinstance(data, dict):
+                    raise ValueError("expected dictionary object")
 
         # verifyclass may need to be locally overridden if the source is
-        # broken. Once we do verify the class, remove it from the dict to
-        # make key iteration safe.
-        if verifyclass and data.get("__class__") != self._dundername:
+        # broken.
+        if verifyclass and data.get("__class__") != dundername:
             if data.get("__class__") is None:
-                raise ValueError("Error validating import data class: __class__ key missing but should be {} (or set verifyclass=False)".format(self._dundername))
+                raise ValueError("Error validating import data class: __class__ key missing but should be {} (or set verifyclass=False)".format(dundername))
             else:
-                raise ValueError("Error validating import data class: got {} object, but expected {}".format(data.get("__class__"), self._dundername))
-        data.pop("__class__", None)
+                raise ValueError("Error validating import data class: got {} object, but expected {}".format(data.get("__class__"), dundername))
+
+        if unchecked:
+            if not owned:
+                data = dict(data)
+            data.pop("__class__", None)
+            for name, dflt in self._attrs_defaults:
+                if name not in data:
+                    data[name] = dflt()
+            self.dict = data
+            return self
 
-        # Run the validator
-        self.dict = self.amethyst_validate_data(data, import_strategy=import_strategy)
+        # Run the validator, which skips the "__class__" key. Subclasses
+        # may override the validator without knowing about that or about
+        # _takeover.
+        if type(self).amethyst_validate_data is Object.amethyst_validate_data:
+            self.dict = self.amethyst_validate_data(data, import_strategy=import_strategy, _takeover=owned)
+        else:
+            data.pop("__class__", None)
+            self.dict = self.amethyst_validate_data(data, import_strategy=import_strategy)
         return self
     load_data = amethyst_load_data
     """
@@ -1087,13 +1493,12 @@ class Object(BaseObject):
         replacing duplicates) by the metaclass at class (not object)
         creation.
         """
-        global global_amethyst_encoders
-
-        if obj.__class__ in self._jsonencoders:
-            return self._jsonencoders[obj.__class__](obj)
-        elif obj.__class__ in global_amethyst_encoders:
-            return global_amethyst_encoders[obj.__class__](obj)
-        raise TypeError("Can't encode {}".format(repr(obj)))
+        if self._merged_version != _amethyst_registry_version:
+            _merge_json_tables(type(self))
+        encoder = self._merged_jsonencoders.get(obj.__class__)
+        if encoder is not None:
+            return encoder(obj)
+        raise TypeError("Can't encode object of type {}".format(type(obj).__name__))
 
     def JSONObjectHook(self, obj):
         """
@@ -1117,14 +1522,13 @@ class Object(BaseObject):
         Keep in mind that JSON input comes from untrusted sources, so
         translators will need to be robust against malformed structures.
         """
-        global global_amethyst_hooks
-        if isinstance(obj, dict) and 1 == len(obj):
-            for key in obj:
-                if key in self._jsonhooks:
-                    return self._jsonhooks[key](obj[key])
-                elif key in global_amethyst_hooks:
-                    return global_amethyst_hooks[key](obj[key])
-        return obj
+        if type(obj) is not dict or len(obj) != 1:
+            return obj
+        if self._merged_version != _amethyst_registry_version:
+            _merge_json_tables(type(self))
+        (key, val), = obj.items()
+        hook = self._merged_jsonhooks.get(key)
+        return obj if hook is None else hook(val)
 
     def toJSON(self, includeclass=None, style=None, **kwargs):
         """
@@ -1148,38 +1552,109 @@ class Object(BaseObject):
 
         The default style is taken from the class :py:attr:`amethyst_classhint_style`
         attribute.
+
+        For large objects, consider :py:func:`toJSONStream` which writes
+        to a file without building the whole JSON string in memory.
         """
+        fast = None
+        if orjson is not None and self.amethyst_fast_json:
+            if self._merged_version != _amethyst_registry_version:
+                _merge_json_tables(type(self))
+            safe = self._merged_orjson_safe
+            if safe is None:
+                safe = type(self)._merged_orjson_safe = _orjson_safe(self._merged_jsonencoders)
+            if safe:
+                fast = _orjson_option(kwargs)
         kwargs.setdefault('default', self.JSONEncoder)
-        includeclass = coalesce(includeclass, self.amethyst_includeclass)
-        style = coalesce(style, self.amethyst_classhint_style)
-        popclass = False
+        if includeclass is None: includeclass = self.amethyst_includeclass
+        if style is None: style = self.amethyst_classhint_style
+
+        cache = None
+        if self.amethyst_cache_json and not self._amethyst_mutable_:
+            cache = getattr(self, "_amethyst_json_cache", None)
+            if cache is None:
+                cache = self._amethyst_json_cache = dict()
+            key = (includeclass, style, tuple(sorted(kwargs.items())))
+            try:
+                return cache[key]
+            except KeyError:
+                pass
+            except TypeError:
+                cache = None# Unhashable json parameters, just don't cache
 
-        try:
-            dump = self.dict
-            if includeclass:
-                if style == "flat":
-                    popclass = True
-                    self.dict["__class__"] = self._dundername
-                elif style == "single-key":
-                    dump = { self._dundername: self.dict }
-                else:
-                    raise AmethystException("Unknown class style '{}'".format(style))
+        dump = self._amethyst_json_root(includeclass, style)
+        rv = None
+        if fast is not None:
+            try:
+                rv = orjson.dumps(dump, default=self.JSONEncoder, option=fast).decode()
+            except orjson.JSONEncodeError:
+                pass# Let json handle it (or report the error)
+        if rv is None:
             rv = json.dumps(dump, **kwargs)
-        finally:
-            if popclass:
-                self.dict.pop("__class__", None)
+        if cache is not None:
+            cache[key] = rv
         return rv
 
+    def toJSONStream(self, fp, includeclass=None, style=None, **kwargs):
+        """
+        Write the JSON serialization of this object to the file-like
+        object `fp` in chunks as it is encoded, rather than building the
+        whole string first as :py:func:`toJSON` does. Parameters are as
+        for :py:func:`toJSON` but are sent to json.dump.
+        """
+        kwargs.setdefault('default', self.JSONEncoder)
+        if includeclass is None: includeclass = self.amethyst_includeclass
+        if style is None: style = self.amethyst_classhint_style
+        json.dump(self._amethyst_json_root(includeclass, style), fp, **kwargs)
+
+    def _amethyst_json_root(self, includeclass, style):
+        """Structure to serialize: self.dict plus any requested class hint."""
+        # Never modify self.dict here, it may be shared or being read
+        # by another thread.
+        dump = self.dict
+        if includeclass:
+            if style == "flat":
+                dump = { **dump, "__class__": self._dundername }
+            elif style == "single-key":
+                dump = { self._dundername: dump }
+            else:
+                raise AmethystException("Unknown class style '{}'".format(style))
+        return dump
+
     @classmethod
     def newFromJSON(cls, source, import_strategy=None, verifyclass=None, **kwargs):
         """ """
         self = cls()
-        mutable = self.amethyst_is_mutable()# In case some subclass is default immutable
-        if not mutable: self.amethyst_make_mutable()
-        self.fromJSON(source, import_strategy=import_strategy, verifyclass=verifyclass, **kwargs)
-        if not mutable: self.amethyst_make_immutable()
+        if self.amethyst_is_mutable():
+            self.fromJSON(source, import_strategy=import_strategy, verifyclass=verifyclass, **kwargs)
+        else:# Some subclass is default immutable
+            self.amethyst_make_mutable()
+            self.fromJSON(source, import_strategy=import_strategy, verifyclass=verifyclass, **kwargs)
+            self.amethyst_make_immutable()
         return self
 
+    @classmethod
+    def newFromJSONList(cls, source, import_strategy=None, verifyclass=None, **kwargs):
+        """
+        Load a JSON list of objects of this class, returning a list of
+        new objects. The JSON is parsed once for the whole list rather
+        than once per object. Parameters are as for :py:func:`newFromJSON`.
+        """
+        data = cls()._amethyst_parse_json(source, **kwargs)
+        if not isinstance(data, list):
+            raise ValueError("expected list of objects")
+        rv = []
+        for item in data:
+            self = cls()
+            if self.amethyst_is_mutable():
+                self.amethyst_load_data(item, import_strategy=import_strategy, verifyclass=verifyclass)
+            else:# Some subclass is default immutable
+                self.amethyst_make_mutable()
+                self.amethyst_load_data(item, import_strategy=import_strategy, verifyclass=verifyclass)
+                self.amethyst_make_immutable()
+            rv.append(self)
+        return rv
+
     def fromJSON(self, source, import_strategy=None, verifyclass=None, **kwargs):
         """
         Paramters are sent directly to json.load or json.loads except:
@@ -1188,13 +1663,26 @@ class Object(BaseObject):
 
         :param verifyclass: Provides a local override to the :py:attr:`amethyst_verifyclass` class attribute.
         """
-        kwargs.setdefault('object_hook', self.JSONObjectHook)
-        if isinstance(source, str):
-            data = json.loads(source, **kwargs)
-        else:
-            data = json.load(source, **kwargs)
+        data = self._amethyst_parse_json(source, **kwargs)
         return self.amethyst_load_data(data, import_strategy=import_strategy, verifyclass=verifyclass)
 
+    def _amethyst_parse_json(self, source, **kwargs):
+        """Parse a JSON string or file, applying this object's JSON hooks."""
+        hook = self.JSONObjectHook
+        if orjson is not None and not kwargs and self.amethyst_fast_json:
+            if not isinstance(source, str):
+                source = source.read()
+            try:
+                data = _apply_object_hook(orjson.loads(source), hook)
+            except orjson.JSONDecodeError:
+                data = json.loads(source, object_hook=hook)
+            return data
+
+        kwargs.setdefault('object_hook', hook)
+        if isinstance(source, str):
+            return json.loads(source, **kwargs)
+        return json.load(source, **kwargs)
+
     def deflate_data(self):
         """
         Deflate object into a "dumb" structure of plain dicts, lists,
@@ -13,6 +13,7 @@ identity
 list_of
 set_of
 smartmatch
+smartmatcher
 tupley
 """.split()
 
@@ -30,10 +31,6 @@ def identity(x):
     return x
 
 
-# Dumb container for python 2 support in list_of() and dict_of()
-class _Container(object):
-    pass
-
 def list_of(conv, container=list, package=None, frame=1):
     """
     An :py:class:`amethyst.core.obj.Attr` helper function which will
@@ -65,19 +62,21 @@ def list_of(conv, container=list, package=None, frame=1):
     :param frame: Frame depth, as described in :py:func:`get_class`.
 
     """
-    c = _Container()  # Closure variable for python 2 support (don't have "nonlocal")
     if frame and package is None and not callable(conv) and (conv.startswith('.') or '.' not in conv):
         package = inspect.getmodule(inspect.stack()[frame][0])
+    conv_fn = conv_is_type = None
 
     def wrapper(thingun):
+        nonlocal conv_fn, conv_is_type
         # May not pre-compute these to allow list_of("Foo") to be called
         # within the declaration of the Foo class.
-        if not getattr(c, 'initialized', False):
-            c.initialized = True
-            c.conv = conv if callable(conv) else get_class(conv, package=package, frame=None)
-            c.conv_is_type = isinstance(c.conv, type)
+        if conv_fn is None:
+            fn = conv if callable(conv) else get_class(conv, package=package, frame=None)
+            conv_is_type = isinstance(fn, type)
+            conv_fn = fn
+        fn, is_type = conv_fn, conv_is_type
         return container(
-            (x if c.conv_is_type and isinstance(x, c.conv) else c.conv(x))
+            (x if is_type and isinstance(x, fn) else fn(x))
             for x in tupley(thingun)
         )
     return wrapper
@@ -133,27 +132,31 @@ def dict_of(conv, key_conv=identity, set_key=None, package=None, frame=1):
     :param frame: Frame depth, as described in :py:func:`get_class`.
 
     """
-    c = _Container()  # Closure variable for python 2 support (don't have "nonlocal")
     if package is None and (
             (not callable(conv) and (conv.startswith('.') or '.' not in conv))
          or (not callable(key_conv) and (key_conv.startswith('.') or '.' not in key_conv))
     ):
         package = inspect.getmodule(inspect.stack()[frame][0])
+    conv_fn = conv_is_type = key_fn = key_is_type = None
 
     def wrapper(d):
+        nonlocal conv_fn, conv_is_type, key_fn, key_is_type
         # May not pre-compute these to allow list_of("Foo") to be called
         # within the declaration of the Foo class.
-        if not getattr(c, 'initialized', False):
-            c.initialized = True
-            c.conv = conv if callable(conv) else get_class(conv, package=package, frame=None)
-            c.conv_is_type = isinstance(c.conv, type)
-            c.key_conv = key_conv if callable(key_conv) else get_class(key_conv, package=package, frame=None)
-            c.key_conv_is_type = isinstance(c.key_conv, type)
-
+        if conv_fn is None:
+            fn = key_conv if callable(key_conv) else get_class(key_conv, package=package, frame=None)
+            key_is_type = isinstance(fn, type)
+            key_fn = fn
+            fn = conv if callable(conv) else get_class(conv, package=package, frame=None)
+            conv_is_type = isinstance(fn, type)
+            conv_fn = fn
+
+        fn, is_type = conv_fn, conv_is_type
+        kfn, key_type = key_fn, key_is_type
         rv = dict()
         for k, v in d.items():
-            key = k if c.key_conv_is_type and isinstance(k, c.key_conv) else c.key_conv(k)
-            val = v if c.conv_is_type and isinstance(v, c.conv) else c.conv(v)
+            key = k if key_type and isinstance(k, kfn) else kfn(k)
+            val = v if is_type and isinstance(v, fn) else fn(v)
             if set_key:
                 set_key(key, val)
             rv[key] = val
@@ -274,6 +277,8 @@ def smartmatch(val, other):
     * anything else: Test ``val == other`` and, if true, return value
 
     If none of the above match, raises a :py:exc:`ValueError`
+
+    .. seealso:: :py:func:`smartmatcher`
     """
     if isinstance(other, (list, tuple, set, frozenset)):
         if val in other:
@@ -300,6 +305,56 @@ def smartmatch(val, other):
     raise ValueError("Invalid Value")
 
 
+def smartmatcher(other, negate=False):
+    """
+    Build a function of one value which behaves like
+    :code:`smartmatch(val, other)`. The type of `other` is inspected once,
+    making the result cheaper than :py:func:`smartmatch` when the same
+    `other` is matched against many values.
+
+    :param bool negate: When true, the function instead returns the value
+        unmodified if it does *not* smartmatch `other` (a callable `other`
+        "matches" when it does not raise a :py:exc:`ValueError`) and raises
+        a :py:exc:`ValueError` if it does.
+    """
+    if isinstance(other, (list, tuple, set, frozenset)):
+        test = other.__contains__
+
+    elif isinstance(other, dict):
+        if not negate:
+            def match(val):
+                if val in other:
+                    return other[val]
+                raise ValueError("Invalid Value")
+            return match
+        test = other.__contains__
+
+    elif isinstance(other, RE_TYPE):
+        test = other.search
+
+    elif callable(other):
+        if not negate:
+            return other
+        def test(val):
+            try:
+                other(val)
+            except ValueError:
+                return False
+            return True
+
+    elif isinstance(other, (type, NONE_TYPE)):
+        test = lambda val: val is other  # noqa E731
+
+    else:
+        test = lambda val: val == other  # noqa E731
+
+    def match(val):
+        if (not test(val)) is negate:
+            return val
+        raise ValueError("Invalid Value")
+    return match
+
+
 class cached_property(object):
     """
     Lazy Attribute Memoization
@@ -5,6 +5,7 @@ A sober python base library
 # SPDX-License-Identifier: LGPL-3.0
 
 import io
+import os
 import re
 import setuptools
 import unittest
@@ -17,6 +18,18 @@ def my_test_suite():
 with io.open('README.rst', encoding='UTF-8') as fh:
     readme = fh.read()
 
+# Optionally compile the object module with Cython. The pure python
+# module remains the reference implementation and is used whenever the
+# compiled extension is unavailable.
+#
+#   AMETHYST_CYTHONIZE=1 python3 setup.py build_ext --inplace
+ext_modules = []
+if os.environ.get('AMETHYST_CYTHONIZE'):
+    from Cython.Build import cythonize
+    ext_modules = cythonize(['amethyst/core/obj.py'], language_level=3)
+    for ext in ext_modules:
+        ext.optional = True
+
 setuptools.setup(
     name         = 'amethyst-core',
     version      = __version__,
@@ -39,4 +52,5 @@ setuptools.setup(
     packages     = setuptools.find_packages(),
     namespace_packages = [ 'amethyst' ],
     test_suite   = 'setup.my_test_suite',
+    ext_modules  = ext_modules,
 )
@@ -240,6 +240,65 @@ class MyTest(unittest.TestCase):
             myobj.set("foo_proofint", 201)
 
 
+    def test_Attr_chain(self):
+        chk = Attr(str).strip().lower()
+        self.assertEqual(chk("  Hello "), "hello")
+        self.assertEqual(chk(b" Hello ".decode()), "hello")
+
+        chk = Attr(isa=(bytes, str)).strip().decode("UTF-8")
+        self.assertEqual(chk(b" Hello "), "Hello")
+        self.assertEqual(chk(" Hello "), "Hello")
+        with self.assertRaises(ValueError):
+            chk(12)
+
+        base = Attr(int, default=3, doc="An int")
+        chk = (0 <= base.int()) < 10
+        self.assertEqual(chk("5"), 5)
+        self.assertIsNone(chk.default, "modifiers do not inherit defaults")
+        self.assertEqual(chk.doc, "An int", "modifiers inherit doc")
+        with self.assertRaises(ValueError):
+            chk(10)
+        self.assertEqual(base("12"), 12, "modifiers do not change base attr")
+
+        chk = (0 < Attr(int)) <= 200
+        self.assertEqual(len(chk._ops), 1, "adjacent comparisons are fused")
+        self.assertEqual(chk("200"), 200)
+        for bad in (0, 201):
+            with self.assertRaises(ValueError):
+                chk(bad)
+        class Checker(object):
+            def __call__(self, value): return value
+            def check(self, value): return True
+        chk = (Attr(int) & Checker()) < 5
+        self.assertEqual(chk("4"), 4, "user callables are not fused")
+        with self.assertRaises(ValueError):
+            chk(5)
+        chk = ((0 < Attr(int)) <= 200) != 5
+        self.assertEqual(chk(4), 4)
+        with self.assertRaises(ValueError):
+            chk(5)
+
+        # Lists may change after the Attr is built
+        allowed, banned = ["a", "b"], ["x"]
+        chk, nchk = Attr(str) == allowed, Attr(str) != banned
+        self.assertEqual(chk("a"), "a")
+        self.assertEqual(nchk("y"), "y")
+        allowed.remove("a")
+        banned.append("y")
+        with self.assertRaises(ValueError):
+            chk("a")
+        with self.assertRaises(ValueError):
+            nchk("y")
+
+        class UpperAttr(Attr):
+            def __call__(self, value, key=None):
+                return super().__call__(value, key).upper()
+
+        chk = UpperAttr(str).strip()
+        self.assertIsInstance(chk, UpperAttr)
+        self.assertEqual(chk(" Hello "), "HELLO")
+
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -4,9 +4,13 @@
 
 import unittest
 
+import datetime
+import io
 import json
 import marshal
+import pickle
 import sqlite3
+import uuid
 
 import amethyst.core.obj
 from amethyst.core import ImmutableObjectException, DuplicateAttributeException
@@ -301,6 +305,24 @@ class MyTest(unittest.TestCase):
         self.assertEqual(myobjn.bar.foo, 12)
         self.assertEqual(myobjn.bar.bar, "Hello")
 
+        # Streaming output matches toJSON and loads from a file
+        fh = io.StringIO()
+        myobj2.toJSONStream(fh)
+        self.assertEqual(fh.getvalue(), json_string)
+        fh.seek(0)
+        self.assertEqual(ObjSer.newFromJSON(fh).bar.foo, 12)
+
+        # Lists of objects, in either class hint style
+        objs = Obj.newFromJSONList("[{}, {}]".format(
+            Obj(foo=1).toJSON(), Obj(foo=2, bip=Obj(foo=3)).toJSON(style="single-key"),
+        ))
+        self.assertEqual([type(o) for o in objs], [Obj, Obj])
+        self.assertEqual([o.foo for o in objs], [1, 2])
+        self.assertIsInstance(objs[1].bip, Obj)
+        self.assertEqual(objs[1].bip.foo, 3)
+        with self.assertRaises(ValueError):
+            Obj.newFromJSONList(Obj(foo=1).toJSON())
+
         # Other serialization libraries
         myobj = Obj(foo=42, bar="Hello")
         deflated = marshal.dumps(myobj.deflate_data())
@@ -347,6 +369,59 @@ class MyTest(unittest.TestCase):
         self.assertEqual(myobj.toJSON(sort_keys=True), '{"bar": "plugh", "foo": 23}')
 
 
+    def test_fast_json(self):
+        try:
+            import orjson  # noqa F401
+        except ImportError:
+            raise unittest.SkipTest("orjson not installed, skipping fast json tests")
+
+        class ObjFast(Object):
+            amethyst_fast_json = True
+            foo = Attr(int)
+            bar = Attr(Obj)
+            baz = Attr(set)
+            bip = Attr()
+
+        myobj = ObjFast(foo=12, bar=Obj(foo=3, bar="hi"), baz=set(["a"]), bip={1: 2})
+        json_string = myobj.toJSON()
+        self.assertNotIn(" ", json_string, "orjson used")
+        self.assertEqual(json.loads(json_string), json.loads(myobj.toJSON(separators=(",", ":"))))
+        self.assertEqual(
+            ObjFast(foo=1, bip="x").toJSON(sort_keys=True),
+            '{{"__class__":"__{}.ObjFast__","bip":"x","foo":1}}'.format(self.__module__)
+        )
+
+        myobj2 = ObjFast.newFromJSON(json_string)
+        self.assertEqual(myobj2.foo, 12)
+        self.assertIsInstance(myobj2.bar, Obj)
+        self.assertEqual(myobj2.bar.bar, "hi")
+        self.assertEqual(myobj2.baz, set(["a"]))
+        self.assertEqual(myobj2.bip, {"1": 2})
+
+        # Fallback to json for things orjson does not support
+        myobj2 = ObjFast.newFromJSON(ObjFast(foo=2**70).toJSON())
+        self.assertEqual(myobj2.foo, 2**70)
+
+        # Documented: orjson writes non-finite floats as null
+        myobj2 = ObjFast.newFromJSON(ObjFast(bip=float("nan")).toJSON())
+        self.assertIsNone(myobj2.bip)
+
+        # Registered encoders win over orjson native types
+        class ObjFastDT(ObjFast):
+            jsonencoders = { datetime.datetime: (lambda dt: { "__dt__": dt.isoformat() }) }
+            jsonhooks = { "__dt__": datetime.datetime.fromisoformat }
+
+        class ObjFastUUID(ObjFast):
+            jsonencoders = { uuid.UUID: (lambda u: { "__uuid__": str(u) }) }
+            jsonhooks = { "__uuid__": uuid.UUID }
+
+        when, uid = datetime.datetime(2020, 1, 2, 3, 4, 5), uuid.uuid4()
+        json_string = ObjFastDT(bip=[when]).toJSON()
+        self.assertNotIn(" ", json_string, "orjson used")
+        self.assertEqual(ObjFastDT.newFromJSON(json_string).bip, [when])
+        self.assertEqual(ObjFastUUID.newFromJSON(ObjFastUUID(bip=[uid]).toJSON()).bip, [uid])
+
+
     def test_immutability(self):
         obj = Obj()
 
@@ -365,6 +440,51 @@ class MyTest(unittest.TestCase):
 
         self.assertEqual(obj["bip"], 23, "Can read values when immutable")
 
+        class ObjCache(Obj):
+            amethyst_cache_json = True
+
+        obj = ObjCache(foo=1)
+        self.assertEqual(json.loads(obj.toJSON())["foo"], 1)
+        obj.foo = 2
+        self.assertEqual(json.loads(obj.toJSON())["foo"], 2, "mutable objects are not cached")
+        obj.amethyst_make_immutable()
+        self.assertIs(obj.toJSON(), obj.toJSON(), "immutable objects are cached")
+        self.assertNotEqual(obj.toJSON(), obj.toJSON(indent=2), "cache keyed on parameters")
+        obj.amethyst_make_mutable()
+        obj.foo = 3
+        self.assertEqual(json.loads(obj.toJSON())["foo"], 3, "cache cleared by make_mutable")
+
+        # Subclasses may override the mutability check
+        checks = []
+        class ObjCheck(Obj):
+            def amethyst_assert_mutable(self, msg="May not modify, object is immutable"):
+                checks.append(msg)
+                return super().amethyst_assert_mutable(msg)
+
+        obj = ObjCheck()
+        obj.foo = 1
+        del obj.foo
+        self.assertEqual(len(checks), 2, "attribute set and del are checked")
+        obj["foo"] = 2
+        obj.set("foo", 3)
+        obj.set(foo=4)
+        del obj["foo"]
+        self.assertEqual(len(checks), 6, "item set, set() and item del are checked")
+
+
+    def test_pickle(self):
+        obj = Obj(foo=23, bip=[1, 2])
+        obj.other = 15
+        obj.amethyst_make_immutable()
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            new = pickle.loads(pickle.dumps(obj, protocol))
+            self.assertEqual(new, obj, "protocol {}".format(protocol))
+            self.assertEqual(new.other, 15, "protocol {}".format(protocol))
+            self.assertFalse(new.amethyst_is_mutable(), "protocol {}".format(protocol))
+
+            new = pickle.loads(pickle.dumps(Object(), protocol))
+            self.assertEqual(new.dict, {}, "protocol {}".format(protocol))
+
 
     def test_subclass(self):
         obj = Obj(foo=23)
@@ -403,6 +523,12 @@ class MyTest(unittest.TestCase):
         obj.fromJSON('{"__class__": "__amethyst.core.obj.Object__", "bab": {"__bob__": "chaz"}, "flags": {"__set__": ["chaz"]}, "baz": "123.45"}', import_strategy="sloppy")
         self.assertEqual(obj.get("bab"), {"__bob__": "chaz"}, "jsonhooks extensions do not modify base classes")
 
+        class ObjSub2(Obj):
+            pass
+        ObjSub2._jsonencoders[complex] = str
+        self.assertNotIn(complex, Obj._jsonencoders, "_jsonencoders edits do not leak to parents")
+        self.assertNotIn(complex, Object._jsonencoders, "_jsonencoders edits do not leak to base classes")
+
 
     def test_default(self):
         class ObjDflt(Object):
@@ -423,6 +549,84 @@ class MyTest(unittest.TestCase):
         self.assertTrue(a.baz is b.baz, "default list initializes identical object")
 
 
+    def test_load_object(self):
+        calls = []
+        class ObjLoad(Object):
+            foo = Attr(lambda v: calls.append(v) or int(v))
+
+        a = ObjLoad(foo="12")
+        self.assertEqual(calls, ["12"])
+
+        b = ObjLoad().load_data(a)
+        self.assertEqual(b.foo, 12)
+        self.assertEqual(calls, ["12"], "same-class load does not re-validate")
+        self.assertTrue(b.dict is not a.dict, "same-class load copies")
+
+        data = { "__class__": ObjLoad._dundername, "foo": 13 }
+        c = ObjLoad().load_data(data, unchecked=True)
+        self.assertEqual(c.foo, 13)
+        self.assertEqual(calls, ["12"], "unchecked load does not validate")
+        self.assertNotIn("__class__", c.dict)
+
+
+    def test_import_strategy(self):
+        class ObjStrategy(Object):
+            foo = Attr(int)
+            bar = Attr(int, default=7)
+            baz = Attr(list, default=list)
+
+        def validate(strategy, **data):
+            return ObjStrategy().amethyst_validate_data(data, import_strategy=strategy)
+
+        with self.assertRaises(ValueError, msg="strict rejects unknown keys"):
+            validate("strict", foo="1", bip=2)
+        self.assertEqual(validate("strict", foo="1"), dict(foo=1, bar=7, baz=[]))
+        self.assertEqual(validate("strict", bar="2"), dict(bar=2, baz=[]))
+        self.assertEqual(
+            validate("strict", foo="1", __class__=ObjStrategy._dundername),
+            dict(foo=1, bar=7, baz=[]),
+            "strict ignores the class hint"
+        )
+
+        self.assertEqual(validate("loose", foo="1", bip=2), dict(foo=1, bar=7, baz=[]), "loose drops unknown keys")
+        self.assertEqual(validate("loose", bar="2", baz=[1]), dict(bar=2, baz=[1]))
+
+        self.assertEqual(
+            validate("sloppy", foo="1", bip=2, __class__=ObjStrategy._dundername),
+            dict(foo=1, bar=7, baz=[], bip=2),
+            "sloppy keeps unknown keys, but not the class hint"
+        )
+        self.assertEqual(validate("sloppy", bar="2"), dict(bar=2, baz=[]))
+
+        # Validation does not change the passed dict
+        for strategy in ("strict", "loose", "sloppy"):
+            data = dict(foo="1")
+            self.assertIsNot(ObjStrategy().amethyst_validate_data(data, import_strategy=strategy), data)
+            self.assertEqual(data, dict(foo="1"))
+
+        # Each object gets a fresh default from a factory
+        a, b = validate("loose"), validate("loose")
+        self.assertIsNot(a["baz"], b["baz"])
+
+        # Strategies also apply when loading
+        with self.assertRaises(ValueError):
+            ObjStrategy().load_data(dict(foo=1, bip=2), import_strategy="strict", verifyclass=False)
+        obj = ObjStrategy().load_data(dict(foo=1, bip=2), import_strategy="loose", verifyclass=False)
+        self.assertEqual(obj.dict, dict(foo=1, bar=7, baz=[]))
+        obj = ObjStrategy().load_data(dict(foo=1, bip=2), import_strategy="sloppy", verifyclass=False)
+        self.assertEqual(obj.dict, dict(foo=1, bar=7, baz=[], bip=2))
+
+        # Sloppy loads adopt the passed dict, converting values in place
+        data = dict(foo="1", bip=2)
+        obj = ObjStrategy().load_data(data, import_strategy="sloppy", verifyclass=False)
+        self.assertIs(obj.dict, data)
+        self.assertEqual(data["foo"], 1)
+        data = dict(foo="1")
+        obj = ObjStrategy().load_data(data, import_strategy="loose", verifyclass=False)
+        self.assertIsNot(obj.dict, data)
+        self.assertEqual(data["foo"], "1")
+
+
     def test_nested(self):
         class ObjNest(Object):
             foo = Attr(int)
@@ -459,6 +663,59 @@ class MyTest(unittest.TestCase):
         self.assertIsNone(new.baz)
         self.assertIsNone(new.bip[0].foo)
 
+    def test_register_type(self):
+        class Point(object):
+            def __init__(self, x, y):
+                self.x, self.y = x, y
+
+        # Registered after Obj was built, must still be seen by Obj
+        amethyst.core.obj.register_amethyst_type(
+            Point, encode=(lambda p: [p.x, p.y]), decode=(lambda l: Point(*l)),
+            name="__test_obj.Point__",
+        )
+        obj = Obj(bip=Point(1, 2))
+        new = Obj.newFromJSON(obj.toJSON())
+        self.assertIsInstance(new.bip, Point)
+        self.assertEqual((new.bip.x, new.bip.y), (1, 2))
+
+    def test_modify_tables(self):
+        class Point(object):
+            def __init__(self, x):
+                self.x = x
+
+        class ObjTables(Object):
+            amethyst_register_type = False
+            foo = Attr()
+
+        ObjTables(foo=1).toJSON()# Build merged tables before modifying
+        ObjTables._jsonencoders[Point] = lambda p: { "__point__": p.x }
+        ObjTables._jsonhooks["__point__"] = Point
+        obj = ObjTables(foo=Point(3))
+        self.assertEqual(json.loads(obj.toJSON())["foo"], { "__point__": 3 })
+        self.assertEqual(obj.deflate_data()["foo"], { "__point__": 3 })
+        self.assertEqual(ObjTables.newFromJSON(obj.toJSON()).foo.x, 3)
+        self.assertEqual(ObjTables.inflate_new(obj.deflate_data()).foo.x, 3)
+
+        class ObjTablesSub(ObjTables):# Defined after the parent tables are in use
+            amethyst_register_type = False
+            jsonencoders = { Point: lambda p: { "__point__": -p.x } }
+        self.assertEqual(ObjTablesSub(foo=Point(3)).deflate_data()["foo"], { "__point__": -3 })
+
+        # Non-Object deflators: their own tables, then the global ones
+        class Deflator(object):
+            _jsonencoders = { Point: lambda p: { "__point__": 2 * p.x } }
+            _jsonhooks = { "__point__": lambda x: Point(x + 1) }
+        self.assertEqual(amethyst_deflate([Point(2), {1}], Deflator()), [{ "__point__": 4 }, [1]])
+        inflated = amethyst_inflate([{ "__point__": 2 }, { "__set__": [1] }], Deflator())
+        self.assertEqual(inflated[0].x, 3)
+        self.assertEqual(inflated[1], {1})
+
+        ObjTables._jsonencoders = {}
+        with self.assertRaises(TypeError):
+            obj.toJSON()
+        with self.assertRaises(TypeError):
+            obj.deflate_data()
+
     def test_integration(self):
         """
         Tests to ensure that we play well with other common libraries.
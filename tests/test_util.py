@@ -2,12 +2,13 @@
 # -*- coding: utf-8 -*-
 # SPDX-License-Identifier: LGPL-3.0
 
+import re
 import threading
 import unittest
 
 import amethyst.core
 from amethyst.core import Attr, cached_property, coalesce, identity, get_class
-from amethyst.core import set_of, list_of, dict_of
+from amethyst.core import set_of, list_of, dict_of, smartmatch, smartmatcher
 
 class Foo(object):
     def __init__(self, bar=None):
@@ -78,6 +79,35 @@ class MyTest(unittest.TestCase):
         self.assertEqual(coalesce(None, 0, None, None), 0, "Match zero")
         self.assertFalse(coalesce(None, False, None, None), "Match falsey")
 
+    def test_smartmatcher(self):
+        def outcome(fn, val):
+            try:
+                return ("ok", fn(val))
+            except ValueError:
+                return ("ValueError", None)
+
+        cases = [
+            (dict(a="A", b="B"), ("a", "b", "c")),                    # dict
+            (["a", "b"], ("a", "c")),                                 # list
+            (("a", "b"), ("a", "c")),                                 # tuple
+            ({"a", "b"}, ("a", "c")),                                 # set
+            (frozenset(["a"]), ("a", "c")),                           # frozenset
+            (re.compile(r"^a"), ("abc", "cba")),                      # regex
+            (int, ("12", "x")),                                       # type (callable)
+            (None, (None, 0, "")),                                    # None
+            (lambda v: int(v) * 2, ("12", "x")),                      # callable
+            (12, (12, 12.0, "12", 13)),                               # equality
+            ("x", ("x", "y")),                                        # equality
+        ]
+        for other, vals in cases:
+            match, nomatch = smartmatcher(other), smartmatcher(other, negate=True)
+            for val in vals:
+                msg = "smartmatch({!r}, {!r})".format(val, other)
+                expect = outcome(lambda v: smartmatch(v, other), val)
+                self.assertEqual(outcome(match, val), expect, msg)
+                negated = ("ValueError", None) if expect[0] == "ok" else ("ok", val)
+                self.assertEqual(outcome(nomatch, val), negated, "negated " + msg)
+
     def _thread_test_cached_property(self, foo, ident, computed):
         # runs in thread, so have to save any exceptions to throw later
         try: